@@ -1,11 +1,10 @@
 """GJSON module."""
-import json
 import os
 import re
 from importlib.metadata import PackageNotFoundError, version
 from typing import Any
 
-from gjson._gjson import MODIFIER_NAME_RESERVED_CHARS, GJSONObj
+from gjson._gjson import DEFAULT_JSON_ENCODER, MODIFIER_NAME_RESERVED_CHARS, GJSONObj
 from gjson._protocols import ModifierProtocol
 from gjson.exceptions import GJSONError, GJSONParseError
 
@@ -78,7 +77,7 @@ class GJSON:
             the JSON-encoded string representing the instantiated object.
 
         """
-        return json.dumps(self._obj, ensure_ascii=False)
+        return DEFAULT_JSON_ENCODER.encode(self._obj)
 
     def get(self, query: str, *, quiet: bool = False) -> Any:
         """Perform a query on the instantiated object and return the resulting object.
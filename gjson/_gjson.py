@@ -1,11 +1,17 @@
 """GJSON module."""
+import heapq
 import json
 import operator
 import re
+import string
+import sys
 from collections import Counter
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass
-from itertools import zip_longest
+from dataclasses import field as dataclass_field
+from functools import cache, lru_cache
+from itertools import chain, filterfalse, islice, zip_longest
+from types import MappingProxyType
 from typing import Any, Optional, Type, TypeVar, Union
 
 from gjson._protocols import ModifierProtocol
@@ -17,16 +23,66 @@ DOT_DELIMITER = '.'
 """str: One of the available delimiters in the query grammar."""
 PIPE_DELIMITER = '|'
 """str: One of the available delimiters in the query grammar."""
-DELIMITERS = (DOT_DELIMITER, PIPE_DELIMITER)
-"""tuple: All the available delimiters in the query grammar."""
-MULTIPATHS_DELIMITERS = (*DELIMITERS, ']', '}', ',')
-"""tuple: All the available delimiters in the query grammar."""
+DELIMITERS = frozenset((DOT_DELIMITER, PIPE_DELIMITER))
+"""frozenset: All the available delimiters in the query grammar."""
+MULTIPATHS_DELIMITERS = DELIMITERS | {']', '}', ','}
+"""frozenset: All the available delimiters in the query grammar inside a multipaths."""
 # Single character operators goes last to avoid mis-detection.
 QUERIES_OPERATORS = ('==~', '==', '!=', '<=', '>=', '!%', '=', '<', '>', '%')
 """tuple: The list of supported operators inside queries."""
 MODIFIER_NAME_RESERVED_CHARS = ('"', ',', '.', '|', ':', '@', '{', '}', '[', ']', '(', ')')
 """tuple: The list of reserver characters not usable in a modifier's name."""
 PARENTHESES_PAIRS = {'(': ')', ')': '(', '[': ']', ']': '[', '{': '}', '}': '{'}
+PARENTHESES_SPECIAL_CHARACTERS_PATTERNS = {
+    opening: re.compile(f'[{re.escape(opening + PARENTHESES_PAIRS[opening])}"\\\\]') for opening in ('(', '[', '{')}
+"""dict: The compiled regular expressions to find the characters relevant to find the closing parentheses, for each
+opening parentheses."""
+WILDCARDS_PATTERN = re.compile(r'(?<!\\)(\?|\*)')  # Negative lookbehind assertion
+"""re.Pattern: The compiled regular expression to find the non-escaped wildcards in a query part."""
+ESCAPED_WILDCARDS_PATTERN = re.compile(r'\\(\*|\?)')
+"""re.Pattern: The compiled regular expression to find the escaped wildcards in a query part."""
+MODIFIER_OPTIONS_DECODER = json.JSONDecoder(strict=False)
+"""json.JSONDecoder: The JSON decoder for the modifier options, that allows to find where the options end."""
+MODIFIER_OPTIONS_SPLIT_PATTERN = re.compile(r'(?<!\\)(\.|\|)')  # Negative lookbehind assertion
+"""re.Pattern: The compiled regular expression to split the query on the delimiters after the modifier options."""
+QUERIES_OPERATORS_PATTERN = re.compile(
+    fr'(?<!\\)({"|".join(re.escape(op) for op in QUERIES_OPERATORS)}|\.?#\()')  # Negative lookbehind assertion
+"""re.Pattern: The compiled regular expression to find the operator or the nested query inside a query."""
+ARRAY_INDEX_PATTERN = re.compile(fr'^([1-9][0-9]*|0)({"|".join(re.escape(i) for i in DELIMITERS)}|$)')
+"""re.Pattern: The compiled regular expression to match an array index query part."""
+MULTIPATHS_ARRAY_INDEX_PATTERN = re.compile(
+    fr'^([1-9][0-9]*|0)({"|".join(re.escape(i) for i in MULTIPATHS_DELIMITERS)}|$)')
+"""re.Pattern: The compiled regular expression to match an array index query part inside a multipaths."""
+LITERAL_STRING_END_PATTERN = re.compile(r'(?<!\\)(")')  # Negative lookbehind assertion
+"""re.Pattern: The compiled regular expression to find the end of a literal string."""
+LITERAL_CONSTANT_PATTERN = re.compile(r'(true|false|null|NaN|(-)?Infinity)')
+"""re.Pattern: The compiled regular expression to match a literal JSON constant, including NaN and Infinity."""
+LITERAL_NUMBER_PATTERN = re.compile(r'-?(0|[1-9][0-9]*)(.[0-9]+)?((e|E)(\+|-|)[0-9]+)?')
+"""re.Pattern: The compiled regular expression to match a literal JSON number."""
+LITERAL_END_PATTERN = re.compile(
+    fr'(?<!\\)({"|".join(re.escape(i) for i in DELIMITERS)}|$)')  # Negative lookbehind assertion
+"""re.Pattern: The compiled regular expression to find the end of a literal."""
+MULTIPATHS_LITERAL_END_PATTERN = re.compile(
+    fr'(?<!\\)({"|".join(re.escape(i) for i in MULTIPATHS_DELIMITERS)}|$)')  # Negative lookbehind assertion
+"""re.Pattern: The compiled regular expression to find the end of a literal inside a multipaths."""
+PLAIN_CHARACTERS_PATTERN = re.compile(r'[^.|@#{[!,\\]*')
+"""re.Pattern: The compiled regular expression to match a sequence of characters without a special meaning in the
+query grammar, that can be part of a field name."""
+DEFAULT_DUMP_PARAMS: Mapping[str, Any] = MappingProxyType({'ensure_ascii': False})
+"""types.MappingProxyType: The read-only default parameters to dump the results to JSON, shared by all the queries
+and replaced by a modified copy only by the modifiers that change them."""
+DEFAULT_JSON_ENCODER = json.JSONEncoder(**DEFAULT_DUMP_PARAMS)
+"""json.JSONEncoder: The JSON encoder with the default dump parameters, reusable as it doesn't keep any state."""
+JSON_PRIMITIVE_TYPES = frozenset((str, float, bool, type(None)))
+"""frozenset: The exact types that can always be converted to JSON, NaN and infinite floats included. Integers are
+not included as the conversion of the very large ones might fail, see :py:data:`SAFE_INT_BITS`."""
+SAFE_INT_BITS = 1993
+"""int: The maximum number of bits of the integers that can always be converted to JSON. They have at most 600 digits,
+below the minimum limit that can be set with :py:func:`sys.set_int_max_str_digits`."""
+QUERY_CACHE_SIZE = 1024
+"""int: The maximum number of parsed queries to keep in cache, to skip the parsing of queries that are repeated."""
+WILDCARD_PATTERNS_CACHE_SIZE = 256
+"""int: The maximum number of compiled regular expressions for the patterns with wildcards to keep in cache."""
 GJSONObjT = TypeVar('GJSONObjT', bound='GJSONObj')
 
 
@@ -55,9 +111,17 @@ class BaseQueryPart:
         return self.part
 
 
+@dataclass
 class FieldQueryPart(BaseQueryPart):
     """Basic field path query part."""
 
+    key: str = dataclass_field(init=False)
+    """The field name with the escape characters removed, computed once when the part is created."""
+
+    def __post_init__(self) -> None:
+        """Compute the unescaped key of the field."""
+        self.key = self.part.replace(ESCAPE_CHARACTER, '')
+
 
 class ArrayLenghtQueryPart(BaseQueryPart):
     """Hash query part, to get the size of an array."""
@@ -85,6 +149,19 @@ class ArrayQueryQueryPart(BaseQueryPart):
     operator: str
     value: Union[str, 'ArrayQueryQueryPart']
     first_only: bool
+    decoded_value: Any = dataclass_field(init=False, default=None)
+    """The JSON-decoded value to compare with. It's computed once when the part is created, so that the value is not
+    decoded again each time a cached query is performed."""
+    is_valid_value: bool = dataclass_field(init=False, default=True)
+    """Whether the value to compare with is valid JSON. The decoding error is not kept as the parts are cached."""
+
+    def __post_init__(self) -> None:
+        """Decode the value to compare with, if there is an operator, deferring the errors to when it's used."""
+        if self.operator and isinstance(self.value, str):
+            try:
+                self.decoded_value = json.loads(self.value, strict=False)
+            except json.JSONDecodeError:
+                self.is_valid_value = False
 
 
 @dataclass
@@ -147,8 +224,8 @@ class GJSONObj:
         """
         self._obj = obj
         self._query = query
-        if custom_modifiers is not None:
-            if (intersection := self.builtin_modifiers().intersection(set(custom_modifiers.keys()))):
+        if custom_modifiers:
+            if (intersection := custom_modifiers.keys() & self.builtin_modifiers()):
                 raise GJSONError(f'Some provided custom_modifiers have the same name of built-in ones: {intersection}.')
 
             for name, modifier in custom_modifiers.items():
@@ -157,20 +234,54 @@ class GJSONObj:
                                      'to the gjson.ModifierProtocol.')
 
         self._custom_modifiers = custom_modifiers if custom_modifiers else {}
-        self._dump_params: dict[str, Any] = {'ensure_ascii': False}
+        self._dump_params: Mapping[str, Any] = DEFAULT_DUMP_PARAMS
         self._after_hash = False
         self._after_query_all = False
+        self._parse_part_handlers = self._parse_part_handlers_functions()
 
     @classmethod
-    def builtin_modifiers(cls: Type[GJSONObjT]) -> set[str]:
-        """Return the names of the built-in modifiers.
+    @cache
+    def builtin_modifiers(cls: Type[GJSONObjT]) -> frozenset[str]:
+        """Return the names of the built-in modifiers, computed only once for each class.
 
         Returns:
             the names of the built-in modifiers.
 
+        """
+        return frozenset(cls._builtin_modifiers_functions())
+
+    @classmethod
+    @cache
+    def _builtin_modifiers_functions(cls: Type[GJSONObjT]) -> dict[str, Callable[..., Any]]:
+        """Return the built-in modifiers functions, computed only once for each class.
+
+        Returns:
+            a dictionary with the built-in modifiers names as keys and their unbound methods as values. The names are
+            interned, like the ones parsed from the queries, so that the lookups match the keys by identity.
+
         """
         prefix = '_apply_modifier_'
-        return {modifier[len(prefix):] for modifier in dir(cls) if modifier.startswith(prefix)}
+        return {sys.intern(name[len(prefix):]): getattr(cls, name) for name in dir(cls) if name.startswith(prefix)}
+
+    @classmethod
+    @cache
+    def _parse_part_handlers_functions(cls: Type[GJSONObjT]) -> dict[Type[BaseQueryPart], Callable[..., Any]]:
+        """Return the functions that handle each type of query part, computed only once for each class.
+
+        Returns:
+            a dictionary with the query part classes as keys and the unbound methods that handle them as values.
+
+        """
+        return {
+            ArrayLenghtQueryPart: cls._parse_part_array_length,
+            ArrayQueryQueryPart: cls._parse_part_array_query,
+            ModifierQueryPart: cls._parse_part_modifier,
+            ArrayIndexQueryPart: cls._parse_part_array_index,
+            FieldQueryPart: cls._parse_part_field,
+            MultipathsObjectQueryPart: cls._parse_part_multipaths_object,
+            MultipathsArrayQueryPart: cls._parse_part_multipaths_array,
+            LiteralQueryPart: cls._parse_part_literal,
+        }
 
     def get(self) -> Any:
         """Perform the query and return the resulting object.
@@ -189,7 +300,7 @@ class GJSONObj:
 
         """
         # Reset internal parameters
-        self._dump_params = {'ensure_ascii': False}
+        self._dump_params = DEFAULT_DUMP_PARAMS
         self._after_hash = False
         self._after_query_all = False
 
@@ -197,11 +308,43 @@ class GJSONObj:
             raise GJSONError('Empty query.')
 
         obj = self._obj
-        for part in self._parse(start=0, end=len(self._query) - 1):
+        for part in self._compile(self._query):
             obj = self._parse_part(part, obj)
 
         return obj
 
+    @classmethod
+    def clear_query_cache(cls: Type[GJSONObjT]) -> None:
+        """Clear the cache of the parsed queries.
+
+        Examples:
+            Clear the cache, the next queries will be parsed again::
+
+                >>> gjson.GJSONObj.clear_query_cache()
+
+        """
+        cls._compile.cache_clear()
+
+    @classmethod
+    @lru_cache(maxsize=QUERY_CACHE_SIZE)
+    def _compile(cls: Type[GJSONObjT], query: str) -> tuple[BaseQueryPart, ...]:
+        """Parse the given query, caching the resulting parts so that repeated queries are parsed only once.
+
+        The parsed parts are shared between all the queries with the same query string, they must not be modified
+        once parsed.
+
+        Arguments:
+            query: the GJSON query to parse.
+
+        Raises:
+            gjson.GJSONParseError: on error.
+
+        Returns:
+            the parsed query parts.
+
+        """
+        return tuple(cls(None, query)._parse(start=0, end=len(query) - 1))  # noqa: SLF001
+
     def __str__(self) -> str:
         """Return the JSON string representation of the object, based on the query parameters.
 
@@ -219,14 +362,27 @@ class GJSONObj:
 
         """
         obj = self.get()
-        prefix = self._dump_params.pop('prefix', '')
-        json_string = json.dumps(obj, **self._dump_params)
+        json_string = self._get_encoder().encode(obj)
+        prefix = self._dump_params.get('prefix', '')
 
         if prefix:
             return '\n'.join(f'{prefix}{line}' for line in json_string.splitlines())
 
         return json_string
 
+    def _get_encoder(self) -> json.JSONEncoder:
+        """Get the JSON encoder to use with the current dump parameters.
+
+        Returns:
+            the default encoder if no modifier changed the dump parameters, a new encoder otherwise. The ``prefix``
+            parameter is not passed to the encoder as it's applied to the encoded string by :py:meth:`__str__`.
+
+        """
+        if self._dump_params is DEFAULT_DUMP_PARAMS:  # Not changed by any modifier, reuse the default encoder
+            return DEFAULT_JSON_ENCODER
+
+        return json.JSONEncoder(**{key: value for key, value in self._dump_params.items() if key != 'prefix'})
+
     def _parse(self, *, start: int, end: int, max_end: int = 0,  # noqa: PLR0912, PLR0913, PLR0915
                delimiter: str = '', in_multipaths: bool = False) -> list[BaseQueryPart]:
         """Parse the query. It will delegate to more specific parsers for each different feature.
@@ -298,7 +454,7 @@ class GJSONObj:
                                             previous=previous)
             elif char == '#' and next_char == '(':
                 part = self._parse_array_query_query_part(start=i, delimiter=delimiter, max_end=max_end)
-            elif re.match(r'[0-9]', char) and not current:
+            elif char in string.digits and not current:
                 part = self._parse_array_index_query_part(start=i, delimiter=delimiter, in_multipaths=in_multipaths)
             elif char == '{':
                 part = self._parse_object_multipaths_query_part(start=i, delimiter=delimiter, max_end=max_end)
@@ -331,6 +487,11 @@ class GJSONObj:
                                               query=self._query, position=i)
 
                     current.append(next_char)
+                else:  # Consume at once all the following characters that don't have a special meaning
+                    plain = PLAIN_CHARACTERS_PATTERN.match(self._query, i + 1, end + 1)
+                    if plain is not None:  # Always true, the pattern matches also an empty string
+                        current.append(plain.group())
+                        i = plain.end() - 1
 
             if part:
                 i = part.end + 1
@@ -355,7 +516,89 @@ class GJSONObj:
             :py:data:`True` if the object is a sequence but not a string or bytes, :py:data:`False` otherwise.
 
         """
-        return isinstance(obj, Sequence) and not isinstance(obj, (str, bytes))
+        # Check the exact list type first as it's much faster than the abstract base class check
+        return type(obj) is list or (isinstance(obj, Sequence) and not isinstance(obj, (str, bytes)))
+
+    @staticmethod
+    def _is_mapping(obj: Any) -> bool:
+        """Check if an object is a mapping.
+
+        Arguments:
+            obj: the object to test.
+
+        Returns:
+            :py:data:`True` if the object is a mapping, :py:data:`False` otherwise.
+
+        """
+        # Check the exact dict type first as it's much faster than the abstract base class check
+        return type(obj) is dict or isinstance(obj, Mapping)
+
+    @staticmethod
+    def _project_key(obj: Any, key: str) -> list[Any]:
+        """Get the values of the given key from all the items of a sequence, skipping non mapping items.
+
+        Items that don't have the given key are skipped too.
+
+        Arguments:
+            obj: the sequence object.
+            key: the key to extract from each item.
+
+        Returns:
+            the list of values.
+
+        """
+        missing = NoResult()
+        # Check the exact dict type first as it's much faster than the abstract base class check
+        return [value for i in obj
+                if (type(i) is dict or isinstance(i, Mapping)) and (value := i.get(key, missing)) is not missing]
+
+    @staticmethod
+    def _most_common(counts: dict[Any, Any], num: Optional[int]) -> dict[Any, Any]:
+        """Return the items with the highest values of a dictionary, like :py:meth:`collections.Counter.most_common`.
+
+        Arguments:
+            counts: the dictionary with the values to compare.
+            num: the number of items to return. If :py:data:`None` all items are returned.
+
+        Returns:
+            a dictionary with the selected items ordered from the highest value.
+
+        """
+        get_value = operator.itemgetter(1)
+        if num is None:  # Sort all items only when all are requested
+            return dict(sorted(counts.items(), key=get_value, reverse=True))
+
+        # Partial selection of the top N items with a heap of size N
+        return dict(heapq.nlargest(num, counts.items(), key=get_value))
+
+    @staticmethod
+    @lru_cache(maxsize=WILDCARD_PATTERNS_CACHE_SIZE)
+    def _wildcard_to_regex(part: str) -> re.Pattern[str]:
+        """Convert a pattern with wildcards into a compiled regular expression that matches the whole string.
+
+        The compiled regular expressions are cached, as the same pattern is usually applied to many objects.
+
+        Arguments:
+            part: the pattern with the ``*`` and ``?`` wildcards, eventually escaped.
+
+        Returns:
+            the compiled regular expression.
+
+        """
+        pattern_parts = ['^']
+        for input_part in WILDCARDS_PATTERN.split(part):
+            if not input_part:
+                continue
+            if input_part == '*':
+                if pattern_parts[-1] != '.*':  # Squash all consecutive * to avoid re.match() performance issue
+                    pattern_parts.append('.*')
+            elif input_part == '?':
+                pattern_parts.append('.')
+            else:
+                pattern_parts.append(re.escape(ESCAPED_WILDCARDS_PATTERN.sub(r'\1', input_part)))
+        pattern_parts.append('$')
+
+        return re.compile(''.join(pattern_parts))
 
     def _find_closing_parentheses(self, *, start: int, opening: str, suffix: str = '',  # noqa: PLR0912
                                   max_end: int = 0) -> int:
@@ -379,17 +622,19 @@ class GJSONObj:
         closing = PARENTHESES_PAIRS[opening]
         opened = 0
         end = -1
-        escaped = False
+        escape_position = -2
         in_string = False
         query = self._query[start:max_end + 1] if max_end else self._query[start:]
 
-        for i, char in enumerate(query):
+        # Jump directly to the next relevant character, skipping all the others
+        for match in PARENTHESES_SPECIAL_CHARACTERS_PATTERNS[opening].finditer(query):
+            i = match.start()
+            char = query[i]
             if char == ESCAPE_CHARACTER:
-                escaped = True
+                escape_position = i
                 continue
 
-            if escaped:
-                escaped = False
+            if i == escape_position + 1:  # Escaped character
                 continue
 
             if char == '"':
@@ -416,11 +661,11 @@ class GJSONObj:
             end += len(suffix)
 
         if end + 1 < len(query):
-            delimiters = list(MULTIPATHS_DELIMITERS) if max_end else list(DELIMITERS)
-            if opening == '(' and suffix == '#':  # Nested queries
-                delimiters.append(')')
+            delimiters = MULTIPATHS_DELIMITERS if max_end else DELIMITERS
+            if max_end and opening == '(' and suffix == '#':  # Nested queries
+                delimiters = delimiters | {')'}
 
-            if (max_end and query[end + 1] not in delimiters) or (not max_end and query[end + 1] not in DELIMITERS):
+            if query[end + 1] not in delimiters:
                 raise GJSONParseError('Expected delimiter or end of query after closing parenthesis.',
                                       query=self._query, position=start + end)
 
@@ -472,7 +717,6 @@ class GJSONObj:
             end = start + i
             name = self._query[start + 1:start + i + 1]
 
-        name.replace(ESCAPE_CHARACTER, '')
         if not name:
             raise GJSONParseError('Got empty modifier name.', query=self._query, position=start)
 
@@ -481,8 +725,9 @@ class GJSONObj:
                 raise GJSONParseError(f'Invalid modifier name @{name}, the following characters are not allowed: '
                                       f'{MODIFIER_NAME_RESERVED_CHARS}', query=self._query, position=start)
 
+        # Intern the name so that the lookup of the modifier function matches the dictionary key by identity
         return ModifierQueryPart(start=start, end=end, part=self._query[start:end + 1], delimiter=delimiter,
-                                 name=name, options=options, is_last=False, previous=None)
+                                 name=sys.intern(name), options=options, is_last=False, previous=None)
 
     def _parse_modifier_options(self, start: int) -> tuple[int, dict[Any, Any]]:
         """Find the modifier options end position in the query starting from a given point.
@@ -505,8 +750,16 @@ class GJSONObj:
             raise GJSONParseError('Expected JSON object `{...}` as modifier options.',
                                   query=self._query, position=start)
 
-        query_parts = re.split(r'(?<!\\)(\.|\|)', self._query[start:])
-        options = None
+        try:  # Decode the JSON object at once, getting also where it ends
+            options, end = MODIFIER_OPTIONS_DECODER.raw_decode(self._query, start)
+        except json.JSONDecodeError as ex:
+            raise GJSONParseError('Unable to load modifier options.', query=self._query, position=start) from ex
+
+        if end == len(self._query) or self._query[end] in DELIMITERS:
+            return end - start, options
+
+        # Fallback to look for the first delimiter after which the options are valid JSON, e.g. trailing whitespaces
+        query_parts = MODIFIER_OPTIONS_SPLIT_PATTERN.split(self._query[start:])
         options_string = ''
         for i in range(0, len(query_parts), 2):
             options_string = ''.join(query_parts[:i + 1])
@@ -549,8 +802,7 @@ class GJSONObj:
         key = ''
         value: Union[str, ArrayQueryQueryPart] = ''
 
-        pattern = '|'.join(re.escape(op) for op in QUERIES_OPERATORS)
-        match = re.search(fr'(?<!\\)({pattern}|\.?#\()', content)  # Negative lookbehind assertion
+        match = QUERIES_OPERATORS_PATTERN.search(content)
         if match:
             query_operator = match.group()
             key = content[:match.start()]
@@ -587,9 +839,8 @@ class GJSONObj:
 
         """
         subquery = self._query[start:]
-        delimiters = MULTIPATHS_DELIMITERS if in_multipaths else DELIMITERS
-        delimiters_match = '|'.join([re.escape(i) for i in delimiters])
-        match = re.search(fr'^([1-9][0-9]*|0)({delimiters_match}|$)', subquery)
+        pattern = MULTIPATHS_ARRAY_INDEX_PATTERN if in_multipaths else ARRAY_INDEX_PATTERN
+        match = pattern.match(subquery)
         if not match:
             return None
 
@@ -787,7 +1038,7 @@ class GJSONObj:
 
         elif begin == '"':
             query = self._query[start + 2:max_end + 1] if max_end else self._query[start + 2:]
-            match = re.search(r'(?<!\\)(")', query)  # Negative lookbehind assertion
+            match = LITERAL_STRING_END_PATTERN.search(query)
             if match is None or match.end() == -1:
                 raise GJSONParseError('Unable to find end of literal string.',
                                       query=self._query, position=start + 2)
@@ -797,16 +1048,15 @@ class GJSONObj:
 
         else:
             query = self._query[start + 1:max_end + 1] if max_end else self._query[start + 1:]
-            if match := re.match(r'(true|false|null|NaN|(-)?Infinity)', query):
+            if match := LITERAL_CONSTANT_PATTERN.match(query):
                 # Includes also Infinite and NaN values:
                 # https://docs.python.org/3/library/json.html#infinite-and-nan-number-values
                 offset = 0
-            elif match := re.match(r'-?(0|[1-9][0-9]*)(.[0-9]+)?((e|E)(\+|-|)[0-9]+)?', query):
+            elif match := LITERAL_NUMBER_PATTERN.match(query):
                 offset = 0  # JSON number
             else:  # Catch until the first delimiter or end of string
-                delimiters = MULTIPATHS_DELIMITERS if in_multipaths else DELIMITERS
-                pattern = '|'.join(re.escape(delimiter) for delimiter in delimiters)
-                match = re.search(fr'(?<!\\)({pattern}|$)', query)  # Negative lookbehind assertion
+                pattern = MULTIPATHS_LITERAL_END_PATTERN if in_multipaths else LITERAL_END_PATTERN
+                match = pattern.search(query)
                 offset = 1 if match and match.group() else 0
 
                 if match is None or match.end() == -1:  # pragma: nocover the above regex always matches
@@ -819,9 +1069,8 @@ class GJSONObj:
         part = self._query[start:end + 1]
         return LiteralQueryPart(start=start, end=end, part=part, delimiter=delimiter, previous=None, is_last=False)
 
-    def _parse_part(self, part: BaseQueryPart, obj: Any, *,  # noqa: PLR0912, PLR0915
-            in_multipaths: bool = False) -> Any:
-        """Parse the given part of the full query.
+    def _parse_part(self, part: BaseQueryPart, obj: Any, *, in_multipaths: bool = False) -> Any:
+        """Parse the given part of the full query, dispatching it to the handler for its type.
 
         Arguments:
             part: the query part as already parsed.
@@ -835,209 +1084,299 @@ class GJSONObj:
             the result of the query.
 
         """
-        in_hash = False
-        in_query_all = False
-        ret: Any
-
         if isinstance(obj, NoResult):
             return obj
 
-        if isinstance(part, ArrayLenghtQueryPart):
-            in_hash = True
-            if part.is_last:
-                if part.delimiter == DOT_DELIMITER and (self._after_hash or self._after_query_all):
-                    ret = []
-                elif part.delimiter == PIPE_DELIMITER and isinstance(part.previous, ArrayLenghtQueryPart):
-                    raise GJSONParseError('The pipe delimiter cannot immediately follow the # element.',
-                                          query=self._query, position=part.start)
-                elif self._is_sequence(obj):
-                    ret = len(obj)
-                else:
-                    raise GJSONParseError('Expected a sequence like object for query part # at the end of the query, '
-                                          f'got {type(obj)}.', query=self._query, position=part.start)
-            else:
-                ret = obj
+        return self._parse_part_handlers[type(part)](self, part, obj, in_multipaths=in_multipaths)
 
-        elif isinstance(part, ArrayQueryQueryPart):
-            if not self._is_sequence(obj):
-                raise GJSONParseError(f'Queries are supported only for sequence like objects, got {type(obj)}.',
-                                      query=self._query, position=part.start)
+    def _parse_part_array_length(self, part: BaseQueryPart, obj: Any, *, in_multipaths: bool) -> Any:
+        """Parse an array length query part ``#``.
 
-            in_query_all = not part.first_only
-            ret = self._parse_query(part, obj)
+        Arguments:
+            part: the query part as already parsed.
+            obj: the current object.
+            in_multipaths: whether the part to be parsed is inside a multipaths.
 
-        elif isinstance(part, ModifierQueryPart):
-            ret = self._apply_modifier(part, obj)
+        Raises:
+            gjson.GJSONParseError: on invalid query.
+
+        Returns:
+            the result of the query.
 
-        elif isinstance(part, ArrayIndexQueryPart):
-            if isinstance(obj, Mapping):  # Integer object keys not supported by JSON
-                if not in_multipaths and part.part not in obj:
-                    raise GJSONParseError(f'Mapping object does not have key `{part}`.',
-                                          query=self._query, position=part.start)
-                ret = obj.get(part.part, NoResult())
+        """
+        del in_multipaths  # unused argument
+        ret: Any
+        if part.is_last:
+            delimiter = part.delimiter
+            if delimiter == DOT_DELIMITER and (self._after_hash or self._after_query_all):
+                ret = []
+            elif delimiter == PIPE_DELIMITER and isinstance(part.previous, ArrayLenghtQueryPart):
+                raise GJSONParseError('The pipe delimiter cannot immediately follow the # element.',
+                                      query=self._query, position=part.start)
             elif self._is_sequence(obj):
-                if (self._after_hash or self._after_query_all) and part.delimiter == DOT_DELIMITER:
-                    # Skip non mapping items and items without the given key
-                    ret = []
-                    for i in obj:
-                        if isinstance(i, Mapping) and part.part in i:
-                            ret.append(i[part.part])
-                        elif self._is_sequence(i) and len(i):
-                            ret.append(i[int(part.part)])
-                elif (self._after_hash and part.delimiter == PIPE_DELIMITER
-                        and isinstance(part.previous, ArrayLenghtQueryPart)):
-                    raise GJSONParseError('Integer query part after a pipe delimiter on an sequence like object.',
-                                          query=self._query, position=part.start)
-                else:
-                    num = len(obj)
-                    if part.index >= num:
-                        raise GJSONParseError(f'Index `{part}` out of range for sequence object with {num} items in '
-                                              'query.', query=self._query, position=part.start)
-                    ret = obj[part.index]
+                ret = len(obj)
             else:
-                raise GJSONParseError(f'Integer query part on unsupported object type {type(obj)}, expected a mapping '
-                                      'or sequence like object.', query=self._query, position=part.start)
-
-        elif isinstance(part, FieldQueryPart):
-            if re.search(r'(?<!\\)(\?|\*)', part.part):  # Wildcards
-                if not isinstance(obj, Mapping):
-                    raise GJSONParseError(f'Wildcard matching key `{part}` requires a mapping object, got {type(obj)} '
-                                          'instead.', query=self._query, position=part.start)
-
-                input_parts = re.split(r'(?<!\\)(\?|\*)', part.part)
-                pattern_parts = ['^']
-                for input_part in input_parts:
-                    if not input_part:
-                        continue
-                    if input_part == '*':
-                        if pattern_parts[-1] != '.*':  # Squash all consecutive * to avoid re.match() performance issue
-                            pattern_parts.append('.*')
-                    elif input_part == '?':
-                        pattern_parts.append('.')
-                    else:
-                        pattern_parts.append(re.escape(re.sub(r'\\(\*|\?)', r'\1', input_part)))
-                pattern_parts.append('$')
-                pattern = ''.join(pattern_parts)
-
-                for key in obj:
-                    if re.match(pattern, key):
-                        ret = obj[key]
-                        break
-                else:
-                    raise GJSONParseError(f'No key matching pattern with wildcard `{part}`.',
-                                          query=self._query, position=part.start)
+                raise GJSONParseError('Expected a sequence like object for query part # at the end of the query, '
+                                      f'got {type(obj)}.', query=self._query, position=part.start)
+        else:
+            ret = obj
 
-            else:
-                key = part.part.replace(ESCAPE_CHARACTER, '')
-                failed = False
-                if not self._after_hash and isinstance(obj, Mapping):
-                    if not in_multipaths and key not in obj:
-                        raise GJSONParseError(f'Mapping object does not have key `{key}`.',
-                                              query=self._query, position=part.start)
-                    ret = obj.get(key, NoResult())
-                elif (self._after_hash or self._after_query_all) and part.delimiter == DOT_DELIMITER:
-                    if self._is_sequence(obj):
-                        # Skip non mapping items and items without the given key
-                        ret = [i[key] for i in obj if isinstance(i, Mapping) and key in i]
-                    elif in_multipaths and isinstance(obj, Mapping):
-                        ret = obj.get(key, NoResult())
-                    elif in_multipaths:
-                        ret = NoResult()
-                    else:
-                        failed = True
-                else:
-                    failed = True
+        self._after_hash = True
+        return ret
 
-                if failed:
-                    raise GJSONParseError(f'Invalid or unsupported query part `{key}`.',
-                                          query=self._query, position=part.start)
+    def _parse_part_array_query(self, part: ArrayQueryQueryPart, obj: Any, *, in_multipaths: bool) -> Any:
+        """Parse an array query part ``#(...)`` or ``#(...)#``.
 
-        elif isinstance(part, MultipathsObjectQueryPart):
-            if ((self._after_hash or self._after_query_all) and part.delimiter == DOT_DELIMITER
-                    and self._is_sequence(obj)):
-                ret = []
-                for i in obj:
-                    obj_item = {}
-                    for obj_part in part.parts:
-                        obj_ret = i
-                        for obj_value in obj_part.values:
-                            obj_ret = self._parse_part(obj_value, obj_ret, in_multipaths=True)
+        Arguments:
+            part: the query part as already parsed.
+            obj: the current object.
+            in_multipaths: whether the part to be parsed is inside a multipaths.
+
+        Raises:
+            gjson.GJSONParseError: on invalid query.
+
+        Returns:
+            the result of the query.
 
-                        if not isinstance(obj_ret, NoResult):
-                            obj_item[obj_part.key] = obj_ret
+        """
+        del in_multipaths  # unused argument
+        if not self._is_sequence(obj):
+            raise GJSONParseError(f'Queries are supported only for sequence like objects, got {type(obj)}.',
+                                  query=self._query, position=part.start)
 
-                    ret.append(obj_item)
-            else:
-                ret = {}
-                for obj_part in part.parts:
-                    obj_ret = obj
-                    for obj_value in obj_part.values:
-                        obj_ret = self._parse_part(obj_value, obj_ret, in_multipaths=True)
-
-                    if not isinstance(obj_ret, NoResult):
-                        ret[obj_part.key] = obj_ret
-
-        elif isinstance(part, MultipathsArrayQueryPart):
-            if ((self._after_hash or self._after_query_all) and part.delimiter == DOT_DELIMITER
-                    and self._is_sequence(obj)):
+        ret = self._parse_query(part, obj)
+        if not part.first_only:
+            self._after_query_all = True
+
+        return ret
+
+    def _parse_part_modifier(self, part: ModifierQueryPart, obj: Any, *, in_multipaths: bool) -> Any:
+        """Parse a modifier query part, applying the modifier.
+
+        Arguments:
+            part: the query part as already parsed.
+            obj: the current object.
+            in_multipaths: whether the part to be parsed is inside a multipaths.
+
+        Raises:
+            gjson.GJSONError: when the modifier raises an exception.
+            gjson.GJSONParseError: on unknown modifier.
+
+        Returns:
+            the result of the query.
+
+        """
+        del in_multipaths  # unused argument
+        return self._apply_modifier(part, obj)
+
+    def _parse_part_array_index(self, part: ArrayIndexQueryPart, obj: Any, *, in_multipaths: bool) -> Any:
+        """Parse an integer query part, that can be an array index or an integer mapping key.
+
+        Arguments:
+            part: the query part as already parsed.
+            obj: the current object.
+            in_multipaths: whether the part to be parsed is inside a multipaths.
+
+        Raises:
+            gjson.GJSONParseError: on invalid query.
+
+        Returns:
+            the result of the query.
+
+        """
+        ret: Any
+        if self._is_mapping(obj):  # Integer object keys not supported by JSON
+            if not in_multipaths and part.part not in obj:
+                raise GJSONParseError(f'Mapping object does not have key `{part}`.',
+                                      query=self._query, position=part.start)
+            ret = obj.get(part.part, NoResult())
+        elif self._is_sequence(obj):
+            after_hash = self._after_hash
+            delimiter = part.delimiter
+            if (after_hash or self._after_query_all) and delimiter == DOT_DELIMITER:
+                # Skip non mapping items and items without the given key
                 ret = []
+                append = ret.append
                 for i in obj:
-                    array_item = []
-                    for array_part in part.parts:
-                        array_ret = i
-                        for array_value in array_part:
-                            array_ret = self._parse_part(array_value, array_ret, in_multipaths=True)
+                    if (type(i) is dict or isinstance(i, Mapping)) and part.part in i:
+                        append(i[part.part])
+                    elif self._is_sequence(i) and len(i):
+                        append(i[int(part.part)])
+            elif after_hash and delimiter == PIPE_DELIMITER and isinstance(part.previous, ArrayLenghtQueryPart):
+                raise GJSONParseError('Integer query part after a pipe delimiter on an sequence like object.',
+                                      query=self._query, position=part.start)
+            else:
+                num = len(obj)
+                if part.index >= num:
+                    raise GJSONParseError(f'Index `{part}` out of range for sequence object with {num} items in '
+                                          'query.', query=self._query, position=part.start)
+                ret = obj[part.index]
+        else:
+            raise GJSONParseError(f'Integer query part on unsupported object type {type(obj)}, expected a mapping '
+                                  'or sequence like object.', query=self._query, position=part.start)
 
-                        if not isinstance(array_ret, NoResult):
-                            array_item.append(array_ret)
+        return ret
 
-                    ret.append(array_item)
-            else:
-                ret = []
-                for array_part in part.parts:
-                    array_ret = obj
-                    for array_value in array_part:
-                        array_ret = self._parse_part(array_value, array_ret, in_multipaths=True)
+    def _parse_part_field(self, part: FieldQueryPart, obj: Any, *, in_multipaths: bool) -> Any:
+        """Parse a field query part, eventually with wildcards.
 
-                    if not isinstance(array_ret, NoResult):
-                        ret.append(array_ret)
+        Arguments:
+            part: the query part as already parsed.
+            obj: the current object.
+            in_multipaths: whether the part to be parsed is inside a multipaths.
 
-        elif isinstance(part, LiteralQueryPart):
-            try:
-                new_obj = json.loads(part.part[1:], strict=False)
-                json_error = ''
-            except json.JSONDecodeError as ex:
-                json_error = str(ex)
-                new_obj = NoResult()
-
-            ret = new_obj
-            if (self._after_hash or self._after_query_all) and self._is_sequence(obj):
-                if part.delimiter == DOT_DELIMITER:
-                    if isinstance(new_obj, NoResult):  # noqa: SIM108
-                        ret = []
-                    else:
-                        ret = [new_obj for _ in obj]
-                elif part.delimiter == PIPE_DELIMITER:
-                    ret = new_obj
-
-            elif not self._after_hash and not self._after_query_all:
-                if part.delimiter == DOT_DELIMITER and not isinstance(new_obj, NoResult):
-                    json_error = 'literal afer a dot delimiter.'
-                    ret = NoResult()
-                elif part.delimiter == PIPE_DELIMITER:
-                    ret = new_obj
-
-            if not in_multipaths and isinstance(ret, NoResult):
-                raise GJSONParseError(
-                    f'Unable to load literal JSON: {json_error}', query=self._query, position=part.start)
-
-        if in_hash:
-            self._after_hash = True
-        if in_query_all:
-            self._after_query_all = True
+        Raises:
+            gjson.GJSONParseError: on invalid query.
+
+        Returns:
+            the result of the query.
+
+        """
+        is_mapping = self._is_mapping(obj)
+        if WILDCARDS_PATTERN.search(part.part):  # Wildcards
+            if not is_mapping:
+                raise GJSONParseError(f'Wildcard matching key `{part}` requires a mapping object, got {type(obj)} '
+                                      'instead.', query=self._query, position=part.start)
+
+            pattern = self._wildcard_to_regex(part.part)
+            # filter() stops at the first matching key, without a Python-level loop over all the keys.
+            match_key = next(filter(pattern.match, obj), None)
+            if match_key is None:
+                raise GJSONParseError(f'No key matching pattern with wildcard `{part}`.',
+                                      query=self._query, position=part.start)
+
+            return obj[match_key]
+
+        key = part.key
+        after_hash = self._after_hash
+        if not after_hash and is_mapping:
+            if not in_multipaths and key not in obj:
+                raise GJSONParseError(f'Mapping object does not have key `{key}`.',
+                                      query=self._query, position=part.start)
+            return obj.get(key, NoResult())
+
+        if (after_hash or self._after_query_all) and part.delimiter == DOT_DELIMITER:
+            if self._is_sequence(obj):
+                return self._project_key(obj, key)
+            if in_multipaths and is_mapping:
+                return obj.get(key, NoResult())
+            if in_multipaths:
+                return NoResult()
+
+        raise GJSONParseError(f'Invalid or unsupported query part `{key}`.', query=self._query, position=part.start)
+
+    def _parse_part_multipaths_object(self, part: MultipathsObjectQueryPart, obj: Any, *, in_multipaths: bool) -> Any:
+        """Parse a multipaths object query part ``{...}``.
+
+        Arguments:
+            part: the query part as already parsed.
+            obj: the current object.
+            in_multipaths: whether the part to be parsed is inside a multipaths.
+
+        Returns:
+            the result of the query.
+
+        """
+        del in_multipaths  # unused argument
+        if ((self._after_hash or self._after_query_all) and part.delimiter == DOT_DELIMITER
+                and self._is_sequence(obj)):
+            # Evaluate each multipaths item on all the elements at once and then zip the columns into objects
+            columns = [[self._parse_multipaths_values(obj_part.values, i) for i in obj] for obj_part in part.parts]
+            rows = zip(*columns) if columns else ((),) * len(obj)
+            return [{obj_part.key: obj_ret for obj_part, obj_ret in zip(part.parts, row)
+                     if not isinstance(obj_ret, NoResult)} for row in rows]
+
+        row = [self._parse_multipaths_values(obj_part.values, obj) for obj_part in part.parts]
+        return {obj_part.key: obj_ret for obj_part, obj_ret in zip(part.parts, row)
+                if not isinstance(obj_ret, NoResult)}
+
+    def _parse_part_multipaths_array(self, part: MultipathsArrayQueryPart, obj: Any, *, in_multipaths: bool) -> Any:
+        """Parse a multipaths array query part ``[...]``.
+
+        Arguments:
+            part: the query part as already parsed.
+            obj: the current object.
+            in_multipaths: whether the part to be parsed is inside a multipaths.
+
+        Returns:
+            the result of the query.
+
+        """
+        del in_multipaths  # unused argument
+        if ((self._after_hash or self._after_query_all) and part.delimiter == DOT_DELIMITER
+                and self._is_sequence(obj)):
+            # Evaluate each multipaths item on all the elements at once and then zip the columns into arrays
+            columns = [[self._parse_multipaths_values(array_part, i) for i in obj] for array_part in part.parts]
+            rows = zip(*columns) if columns else ((),) * len(obj)
+            return [[array_ret for array_ret in row if not isinstance(array_ret, NoResult)] for row in rows]
+
+        row = [self._parse_multipaths_values(array_part, obj) for array_part in part.parts]
+        return [array_ret for array_ret in row if not isinstance(array_ret, NoResult)]
+
+    def _parse_part_literal(self, part: LiteralQueryPart, obj: Any, *, in_multipaths: bool) -> Any:
+        """Parse a literal query part ``!...``.
+
+        Arguments:
+            part: the query part as already parsed.
+            obj: the current object.
+            in_multipaths: whether the part to be parsed is inside a multipaths.
+
+        Raises:
+            gjson.GJSONParseError: on invalid query.
+
+        Returns:
+            the result of the query.
+
+        """
+        try:
+            new_obj = json.loads(part.part[1:], strict=False)
+            json_error = ''
+        except json.JSONDecodeError as ex:
+            json_error = str(ex)
+            new_obj = NoResult()
+
+        ret = new_obj
+        after_hash_or_query_all = self._after_hash or self._after_query_all
+        delimiter = part.delimiter
+        if after_hash_or_query_all and self._is_sequence(obj):
+            if delimiter == DOT_DELIMITER:
+                if isinstance(new_obj, NoResult):  # noqa: SIM108
+                    ret = []
+                else:
+                    ret = [new_obj for _ in obj]
+            elif delimiter == PIPE_DELIMITER:
+                ret = new_obj
+
+        elif not after_hash_or_query_all:
+            if delimiter == DOT_DELIMITER and not isinstance(new_obj, NoResult):
+                json_error = 'literal afer a dot delimiter.'
+                ret = NoResult()
+            elif delimiter == PIPE_DELIMITER:
+                ret = new_obj
+
+        if not in_multipaths and isinstance(ret, NoResult):
+            raise GJSONParseError(
+                f'Unable to load literal JSON: {json_error}', query=self._query, position=part.start)
 
         return ret
 
+    def _parse_multipaths_values(self, values: list[BaseQueryPart], obj: Any) -> Any:
+        """Apply in sequence all the query parts of a single multipaths item to the given object.
+
+        Arguments:
+            values: the query parts of the multipaths item.
+            obj: the current object.
+
+        Returns:
+            the result of the multipaths item query, an instance of :py:class:`gjson._gjson.NoResult` if there is no
+            result.
+
+        """
+        for value in values:
+            obj = self._parse_part(value, obj, in_multipaths=True)
+
+        return obj
+
     def _evaluate_query_return_value(self, query: ArrayQueryQueryPart, obj: Any) -> Any:
         """Evaluate the return value of an inline query #(...) / #(...)# depending on first match or all matches.
 
@@ -1080,7 +1419,7 @@ class GJSONObj:
             for i in obj:
                 nested_obj = None
                 if query.field:
-                    if isinstance(i, Mapping) and query.field in i:
+                    if (type(i) is dict or isinstance(i, Mapping)) and query.field in i:
                         nested_obj = i[query.field]
                 elif self._is_sequence(i):
                     nested_obj = i
@@ -1091,17 +1430,23 @@ class GJSONObj:
             return self._evaluate_query_return_value(query, ret)
 
         if not query.operator:
-            return self._evaluate_query_return_value(query, [i for i in obj if query.field in i])
+            matching: Iterable[Any] = (i for i in obj if query.field in i)
+            if query.first_only:  # Stop at the first matching item
+                matching = islice(matching, 1)
+            return self._evaluate_query_return_value(query, list(matching))
 
-        key = query.field.replace('\\', '')
-        try:
-            value = json.loads(query.value, strict=False)
-        except json.JSONDecodeError as ex:
+        key = query.field.replace(ESCAPE_CHARACTER, '')
+        if not query.is_valid_value:
             position = query.start + len(query.field) + len(query.operator)
-            raise GJSONParseError(f'Invalid value `{query.value}` for the query key `{key}`.',
-                                  query=self._query, position=position) from ex
+            try:  # Decode the value again only to chain the decoding error, this is not a hot path
+                json.loads(str(query.value), strict=False)
+            except json.JSONDecodeError as ex:
+                raise GJSONParseError(f'Invalid value `{query.value}` for the query key `{key}`.',
+                                      query=self._query, position=position) from ex
+
+        value = query.decoded_value
 
-        if not key and query.first_only and obj and isinstance(obj[0], Mapping):
+        if not key and query.first_only and obj and self._is_mapping(obj[0]):
             raise GJSONParseError('Query on mapping like objects require a key before the operator.',
                                   query=self._query, position=query.start)
 
@@ -1134,19 +1479,20 @@ class GJSONObj:
         elif query.operator == '>=':
             oper = operator.ge
         elif query.operator in ('%', '!%'):
-            value = str(value).replace('*', '.*').replace('?', '.')
-            value = f'^{value}$'
+            pattern = self._wildcard_to_regex(str(value))
             if query.operator == '%':
                 def match_op(obj_a: Any, obj_b: Any) -> bool:
+                    del obj_b  # unused argument, the pattern is already compiled
                     if not isinstance(obj_a, str):
                         return False
-                    return re.match(obj_b, obj_a) is not None
+                    return pattern.match(obj_a) is not None
                 oper = match_op
             else:
                 def not_match_op(obj_a: Any, obj_b: Any) -> bool:
+                    del obj_b  # unused argument, the pattern is already compiled
                     if not isinstance(obj_a, str):
                         return False
-                    return re.match(obj_b, obj_a) is None
+                    return pattern.match(obj_a) is None
                 oper = not_match_op
 
         try:
@@ -1154,7 +1500,14 @@ class GJSONObj:
                 if query.operator == '==~':  # Consider missing keys as falsy according to GJSON docs.
                     ret = [i for i in obj if oper(i.get(key), value)]
                 else:
-                    ret = [i for i in obj if key in i and oper(i[key], value)]
+                    missing = NoResult()
+                    try:  # Single lookup for each item when all items are mappings
+                        ret = [i for i in obj
+                               if (item_value := i.get(key, missing)) is not missing and oper(item_value, value)]
+                    except AttributeError:  # Not all items are mappings, fallback to the membership check
+                        ret = [i for i in obj if key in i and oper(i[key], value)]
+            elif query.operator == '==~':  # Query on an array of non-objects, filter() performs the truth test in C
+                ret = list(filter(None, obj) if value else filterfalse(None, obj))
             else:  # Query on an array of non-objects, match them directly
                 ret = [i for i in obj if oper(i, value)]
         except TypeError:
@@ -1177,21 +1530,22 @@ class GJSONObj:
             the object modifier according to the modifier.
 
         """
+        builtin_func = self._builtin_modifiers_functions().get(modifier.name)
+        custom_func = self._custom_modifiers.get(modifier.name) if builtin_func is None else None
         try:
-            modifier_func = getattr(self, f'_apply_modifier_{modifier.name}')
-        except AttributeError:
-            modifier_func = self._custom_modifiers.get(modifier.name)
-            if modifier_func is None:
-                raise GJSONParseError(f'Unknown modifier @{modifier.name}.',
-                                      query=self._query, position=modifier.start) from None
+            if builtin_func is not None:
+                return builtin_func(self, modifier.options, obj, last=modifier.is_last)
 
-        try:
-            return modifier_func(modifier.options, obj, last=modifier.is_last)
+            if custom_func is not None:
+                # The parsed query is cached, don't expose its options to custom modifiers
+                return custom_func(dict(modifier.options), obj, last=modifier.is_last)
         except GJSONError:
             raise
         except Exception as ex:
             raise GJSONError(f'Modifier @{modifier.name} raised an exception.') from ex
 
+        raise GJSONParseError(f'Unknown modifier @{modifier.name}.', query=self._query, position=modifier.start)
+
     def _apply_modifier_reverse(self, _options: dict[str, Any], obj: Any, *, last: bool) -> Any:
         """Apply the @reverse modifier.
 
@@ -1205,6 +1559,8 @@ class GJSONObj:
 
         """
         del last  # unused argument
+        if isinstance(obj, dict):  # Dictionaries items are reversible, no need to lookup each key
+            return dict(reversed(obj.items()))
         if isinstance(obj, Mapping):
             return {k: obj[k] for k in reversed(obj.keys())}
         if self._is_sequence(obj):
@@ -1267,8 +1623,7 @@ class GJSONObj:
 
         """
         del last  # unused argument
-        self._dump_params['separators'] = (',', ':')
-        self._dump_params['indent'] = None
+        self._dump_params = {**self._dump_params, 'separators': (',', ':'), 'indent': None}
         return obj
 
     def _apply_modifier_pretty(self, options: dict[str, Any], obj: Any, *, last: bool) -> Any:
@@ -1284,9 +1639,12 @@ class GJSONObj:
 
         """
         del last  # unused argument
-        self._dump_params['indent'] = options.get('indent', 2)
-        self._dump_params['sort_keys'] = options.get('sortKeys', False)
-        self._dump_params['prefix'] = options.get('prefix', '')
+        self._dump_params = {
+            **self._dump_params,
+            'indent': options.get('indent', 2),
+            'sort_keys': options.get('sortKeys', False),
+            'prefix': options.get('prefix', ''),
+        }
         return obj
 
     def _apply_modifier_ascii(self, _options: dict[str, Any], obj: Any, *, last: bool) -> Any:
@@ -1302,7 +1660,7 @@ class GJSONObj:
 
         """
         del last  # unused argument
-        self._dump_params['ensure_ascii'] = True
+        self._dump_params = {**self._dump_params, 'ensure_ascii': True}
         return obj
 
     def _apply_modifier_sort(self, _options: dict[str, Any], obj: Any, *, last: bool) -> Any:
@@ -1321,8 +1679,8 @@ class GJSONObj:
 
         """
         del last  # unused argument
-        if isinstance(obj, Mapping):
-            return {k: obj[k] for k in sorted(obj.keys())}
+        if self._is_mapping(obj):
+            return dict(sorted(obj.items(), key=operator.itemgetter(0)))
         if self._is_sequence(obj):
             return sorted(obj)
 
@@ -1345,8 +1703,15 @@ class GJSONObj:
 
         """
         del last  # unused argument
+        obj_type = type(obj)
+        # The modifiers never disable allow_nan, no need to encode it
+        if obj_type in JSON_PRIMITIVE_TYPES or (obj_type is int and obj.bit_length() <= SAFE_INT_BITS):
+            return obj
+
+        encoder = self._get_encoder()
         try:
-            json.dumps(obj, **self._dump_params)
+            # Discard the result, encode() uses the C encoder while iterencode() always uses the pure Python one
+            encoder.encode(obj)
         except Exception as ex:
             raise GJSONError('The current object cannot be converted to JSON.') from ex
 
@@ -1436,15 +1801,15 @@ class GJSONObj:
 
         """
         del last  # unused argument
-        if not isinstance(obj, Mapping):
+        if not self._is_mapping(obj):
             raise GJSONError(f'Modifier @group got object of type {type(obj)} as input, expected dictionary.')
 
         # Skip all values that aren't lists:
-        obj = {k: v for k, v in obj.items() if self._is_sequence(v)}
-        # Fill missing values with NoResult to remove them afterwards
-        obj = [dict(zip_longest(obj.keys(), values)) for values in zip_longest(*obj.values(), fillvalue=NoResult())]
-        # Skip keys with value NoResult in each dictionary
-        return [{k: v for k, v in i.items() if not isinstance(v, NoResult)} for i in obj]
+        keys = [k for k, v in obj.items() if self._is_sequence(v)]
+        # Fill missing values with a NoResult instance to skip them while building each dictionary
+        missing = NoResult()
+        return [{k: v for k, v in zip(keys, values) if v is not missing}
+                for values in zip_longest(*(obj[k] for k in keys), fillvalue=missing)]
 
     def _apply_modifier_join(self, _options: dict[str, Any], obj: Any, *, last: bool) -> Any:
         """Apply the @join modifier, that joins a list of dictionaries into a single dictionary.
@@ -1476,7 +1841,7 @@ class GJSONObj:
 
         ret: dict[Any, Any] = {}
         for item in obj:
-            if isinstance(item, Mapping):
+            if type(item) is dict or isinstance(item, Mapping):
                 ret.update(item)
 
         return ret
@@ -1502,6 +1867,7 @@ class GJSONObj:
             raise GJSONError(f'@top_n modifier not supported for object of type {type(obj)}. '
                              'Expected a sequence like object.')
 
+        # Counter.most_common() already uses heapq.nlargest() when n is set, sorting all items only when n is None
         return dict(Counter(obj).most_common(options.get('n')))
 
     def _apply_modifier_sum_n(self, options: dict[str, Any], obj: Any, *, last: bool) -> Any:
@@ -1529,10 +1895,16 @@ class GJSONObj:
             raise GJSONError(f'@sum_n modifier not supported for object of type {type(obj)}. '
                              'Expected a sequence like object.')
 
-        results: Counter[Any] = Counter()
-        for item in obj:
-            results[item[options['group']]] += item[options['sum']]
-        return dict(results.most_common(options.get('n')))
+        if not obj:  # Nothing to group, the options are not required
+            return {}
+
+        get_group_and_sum = operator.itemgetter(options['group'], options['sum'])
+        results: dict[Any, Any] = {}
+        get_result = results.get
+        for group, value in map(get_group_and_sum, obj):  # Extract all the pairs in C, only the sum is in Python
+            results[group] = get_result(group, 0) + value
+
+        return self._most_common(results, options.get('n'))
 
     def _apply_modifier_flatten(self, options: dict[str, Any], obj: Any, *, last: bool) -> Any:
         """Apply the @flatten modifier.
@@ -1550,25 +1922,61 @@ class GJSONObj:
         if not self._is_sequence(obj):
             return obj
 
-        return list(self._flatten_sequence(obj, deep=options.get('deep', False)))
+        deep = options.get('deep', False)
+        # Fast path, all items are sequences: the shallow flattening is a plain concatenation performed in C
+        if not deep and all(map(self._is_sequence, obj)):
+            return list(chain.from_iterable(obj))
 
-    def _flatten_sequence(self, obj: Any, *, deep: bool = False) -> Any:
-        """Flatten nested sequences in the given object.
+        return self._flatten_sequence(obj, deep=deep)
+
+    def _flatten_sequence(self, obj: Any, *, deep: bool = False) -> list[Any]:
+        """Flatten nested sequences in the given sequence object.
 
         Arguments:
             obj: the current object to flatten
             deep: if :py:data:`True` recursively flatten nested sequences. By default only the first level is
                 processed.
 
+        Raises:
+            gjson.GJSONError: if a nested sequence contains itself when flattening recursively.
+
         Returns:
-            the flattened object if it was a flattable sequence, the given object itself otherwise.
+            the flattened sequence as a list.
 
         """
-        for elem in obj:
-            if self._is_sequence(elem):
-                if deep:
-                    yield from self._flatten_sequence(elem, deep=deep)
+        ret: list[Any] = []
+        append = ret.append
+        is_sequence = self._is_sequence
+        if not deep:
+            extend = ret.extend
+            for elem in obj:
+                if type(elem) is list or is_sequence(elem):
+                    extend(elem)
                 else:
-                    yield from elem
-            else:
-                yield elem
+                    append(elem)
+
+            return ret
+
+        # Walk nested sequences with an explicit stack of iterators instead of recursion, tracking the ids of the
+        # sequences being walked to detect circular references like json.JSONEncoder with check_circular does.
+        stack = [iter(obj)]
+        path = [id(obj)]
+        walking = set(path)
+        while stack:
+            for elem in stack[-1]:
+                if type(elem) is list or is_sequence(elem):
+                    elem_id = id(elem)
+                    if elem_id in walking:
+                        raise GJSONError('@flatten modifier does not support sequences with circular references.')
+
+                    stack.append(iter(elem))
+                    path.append(elem_id)
+                    walking.add(elem_id)
+                    break
+
+                append(elem)
+            else:  # The current iterator is exhausted
+                stack.pop()
+                walking.remove(path.pop())
+
+        return ret
@@ -1,5 +1,5 @@
 """gjson custom exceptions module."""
-from typing import Any
+from typing import Any, Optional
 
 
 class GJSONError(Exception):
@@ -21,9 +21,22 @@ class GJSONParseError(GJSONError):
         super().__init__(*args)
         self.query = query
         self.position = position
+        self._str: Optional[str] = None
 
     def __str__(self) -> str:
-        """Return a custom representation of the error.
+        """Return a custom representation of the error, rendered only once.
+
+        Returns:
+            the whole query string with a clear indication on where the error occurred.
+
+        """
+        if self._str is None:
+            self._str = self._render()
+
+        return self._str
+
+    def _render(self) -> str:
+        """Render the custom representation of the error.
 
         Returns:
             the whole query string with a clear indication on where the error occurred.
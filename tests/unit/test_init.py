@@ -1,8 +1,10 @@
 """GJSON test module."""
 import json
 import re
-from collections.abc import Mapping
+import sys
+from collections.abc import Mapping, Sequence
 from math import isnan
+from types import MappingProxyType
 
 import gjson
 import pytest
@@ -46,8 +48,8 @@ INPUT_ESCAPE = json.loads("""
 }
 """)
 # This json block is poorly formed on purpose.
-INPUT_BASIC = json.loads("""
-  {"age":100, "name2":{"here":"B\\\\\\"R"},
+INPUT_BASIC = json.loads(r"""
+  {"age":100, "name2":{"here":"B\\\"R"},
     "noop":{"what is a wren?":"a bird"},
     "happy":true,"immortal":false,
     "items":[1,2,3,{"tags":[1,2,3],"points":[[1,2],[3,4]]},4,5,6,7],
@@ -212,6 +214,8 @@ class TestObject:
         ('friends.#(>40)#', []),
         ('children.#(!%"*a*")', 'Alex'),
         ('children.#(%"*a*")#', ['Sara', 'Jack']),
+        ('children.#(%"S.ra")#', []),
+        ('children.#(%"S[a]ra")#', []),
         # Nested queries
         ('friends.#(nets.#(=="fb"))#.first', ['Dale', 'Roger']),
         # Modifiers
@@ -574,6 +578,8 @@ class TestTruthiness:
         ('vals.#(b==~false).a', 3),
         ('vals.#(b==~false)#.a', [3, 5, 9, 10, 11]),
         ('vals.#(b==~"invalid")#', []),
+        ('vals.#.b|#(==~true)#', [True, True, '0', '1', 1, 'true']),
+        ('vals.#.b|#(==~false)#', [False, 0, False, None]),
     ))
     def test_get_ok(self, query, expected):
         """It should query the JSON object and return the expected result."""
@@ -678,6 +684,24 @@ def test_get_modifier_valid_raise():
     assert obj.get('@valid', quiet=True) is None
 
 
+@pytest.mark.skipif(not hasattr(sys, 'get_int_max_str_digits'), reason='No integer string conversion length limit')
+def test_get_modifier_valid_huge_integer_raise():
+    """It should raise a GJSONError if the integer has more digits than the allowed ones to be converted to string."""
+    with pytest.raises(gjson.GJSONError, match=r'^The current object cannot be converted to JSON.'):
+        gjson.GJSON({'key': 10**(sys.get_int_max_str_digits() + 1)}).get('key.@valid')
+
+
+@pytest.mark.parametrize('value', ('a string', 12, 10**1000, 1.5, True, None))
+def test_get_modifier_valid_primitives(value):
+    """It should return the primitive values unmodified."""
+    assert gjson.GJSON({'key': value}).get('key.@valid') == value
+
+
+def test_get_modifier_valid_nan():
+    """It should consider NaN a valid value, as the encoder allows it."""
+    assert isnan(gjson.GJSON({'key': float('nan')}).get('key.@valid'))
+
+
 @pytest.mark.parametrize(('data', 'expected'), (
     ('[3, 1, 5, 8, 2]', [1, 2, 3, 5, 8]),
     ('{"b": 2, "d": 4, "c": 3, "a": 1}', {'a': 1, 'b': 2, 'c': 3, 'd': 4}),
@@ -689,6 +713,39 @@ def test_get_modifier_sort(data, expected):
     compare_values(obj.get('@sort', quiet=True), expected)
 
 
+@pytest.mark.parametrize(('query', 'expected'), (
+    ('@flatten', [1, 2, 3, [4, 5]]),
+    ('@flatten:{"deep":true}', [1, 2, 3, 4, 5]),
+))
+def test_get_modifier_flatten_only_sequences(query, expected):
+    """It should flatten a sequence whose items are all sequences."""
+    obj = gjson.GJSON([[1, 2], [], [3, [4, 5]]])
+    assert obj.get(query) == expected
+
+
+def test_get_modifier_flatten_deeply_nested():
+    """It should flatten sequences nested deeper than the recursion limit."""
+    data = [1]
+    for i in range(2, 10002):
+        data = [data, i]
+
+    assert gjson.GJSON(data).get('@flatten:{"deep":true}') == list(range(1, 10002))
+
+
+def test_get_modifier_flatten_deep_circular_reference():
+    """It should raise a GJSONError if a nested sequence contains itself, without looping forever."""
+    data = [1, [2]]
+    data[1].append(data)
+    with pytest.raises(gjson.GJSONError, match=r'^@flatten modifier does not support sequences with circular'):
+        gjson.GJSON(data).get('@flatten:{"deep":true}')
+
+
+def test_get_modifier_flatten_deep_repeated_sequence():
+    """It should flatten the same sequence repeated in different positions, as it's not a circular reference."""
+    nested = [1, [2]]
+    assert gjson.GJSON([nested, [nested], nested]).get('@flatten:{"deep":true}') == [1, 2, 1, 2, 1, 2]
+
+
 @pytest.mark.parametrize(('data', 'query', 'expected'), (
     ({'a': '{"b": 25}'}, 'a.@fromstr', {'b': 25}),
     ({'a': '{"b": 25}'}, 'a.@fromstr.b', 25),
@@ -748,6 +805,84 @@ def test_get_integer_index_on_mapping():
     assert obj.get('11') == 7
 
 
+def test_get_query_on_mixed_items():
+    """It should skip the items that are not mappings or that don't have the key."""
+    obj = gjson.GJSON([{'a': 1}, [1, 2], {'b': 3}, {'a': 2}])
+    assert obj.get('#(a>=1)#') == [{'a': 1}, {'a': 2}]
+
+
+def test_get_non_dict_mapping_and_sequence_types():
+    """It should support any mapping and sequence like object, not only dictionaries and lists."""
+    obj = gjson.GJSON(MappingProxyType({'a': (MappingProxyType({'b': 1}), {'b': 2})}))
+    assert obj.get('a.#.b') == [1, 2]
+    assert obj.get('a.0.b') == 1
+    assert obj.get('a|@reverse|#.b') == [2, 1]
+
+
+def test_get_registered_sequence_type():
+    """It should consider sequence like a class registered as virtual subclass after having queried it already."""
+    class RegisteredSequence:
+        """A class that becomes a sequence only once registered."""
+
+        def __init__(self, *items):
+            self._items = items
+
+        def __getitem__(self, index):
+            return self._items[index]
+
+        def __len__(self):
+            return len(self._items)
+
+    obj = gjson.GJSON({'a': RegisteredSequence(1, 2)})
+    with pytest.raises(gjson.GJSONError):
+        obj.get('a.#')
+
+    Sequence.register(RegisteredSequence)
+    assert obj.get('a.#') == 2
+
+
+def test_get_query_existence_first_only():
+    """It should stop at the first item that has the key without checking the following ones."""
+    assert gjson.GJSON([{'b': 0}, {'a': 1}, 5]).get('#(a)') == {'a': 1}
+
+
+def test_gjsonobj_query_cache():
+    """It should parse the same query only once and parse it again after clearing the cache."""
+    compile_query = gjson.GJSONObj._compile  # noqa: SLF001
+    gjson.GJSONObj.clear_query_cache()
+    assert gjson.GJSONObj(INPUT_OBJECT, 'name.first').get() == 'Tom'
+    assert gjson.GJSONObj(INPUT_OBJECT, 'name.first').get() == 'Tom'
+    assert compile_query.cache_info().hits == 1
+    assert compile_query.cache_info().misses == 1
+
+    gjson.GJSONObj.clear_query_cache()
+    assert compile_query.cache_info().currsize == 0
+
+
+def test_gjsonobj_query_cache_invalid_value():
+    """It should raise a new error chained to a new decoding error each time a cached invalid query is performed."""
+    causes = []
+    for _ in range(2):
+        with pytest.raises(gjson.GJSONParseError, match=r'^Invalid value `{1: 2}` for the query key `last`') as ex:
+            gjson.GJSONObj(INPUT_OBJECT, 'friends.#(last=={1: 2})').get()
+
+        assert isinstance(ex.value.__cause__, json.JSONDecodeError)
+        causes.append(ex.value.__cause__)
+
+    assert causes[0] is not causes[1]
+
+
+def test_gjsonobj_wildcard_patterns_cache():
+    """It should convert the same wildcard pattern to a regular expression only once."""
+    wildcard_to_regex = gjson.GJSONObj._wildcard_to_regex  # noqa: SLF001
+    wildcard_to_regex.cache_clear()
+    assert gjson.GJSONObj(INPUT_OBJECT, 'c?ildren.0').get() == 'Sara'
+    assert gjson.GJSONObj(INPUT_OBJECT, 'children.#(%"*a*")#').get() == ['Sara', 'Jack']
+    assert gjson.GJSONObj(INPUT_OBJECT, 'children.#(%"*a*")#').get() == ['Sara', 'Jack']
+    assert wildcard_to_regex.cache_info().hits > 0
+    assert wildcard_to_regex.cache_info().misses == 2
+
+
 def test_module_get():
     """It should return the queried object."""
     assert gjson.get({'key': 'value'}, 'key') == 'value'
@@ -835,6 +970,12 @@ def test_get_modifier_sum_n_invalid_options(options):
         obj.get(f'@sum_n{options}')
 
 
+@pytest.mark.parametrize('options', ('', ':{"group": "key"}', ':{"group": "key", "sum": "value", "n": 2}'))
+def test_get_modifier_sum_n_empty(options):
+    """It should return an empty dictionary if the object is empty, regardless of the options."""
+    assert gjson.GJSON([]).get(f'@sum_n{options}') == {}
+
+
 class TestJSONOutput:
     """Test class for all JSON output functionalities."""
 
@@ -859,6 +1000,12 @@ class TestJSONOutput:
         assert self.gjson.getj(self.query) == self.value
         assert self.gjson.getj('', quiet=True) == ''
 
+    def test_gjson_getj_dump_params_not_shared(self):
+        """It should not apply the output modifiers of a query to the following queries."""
+        assert self.gjson.getj('@pretty:{"prefix": "# "}|@ascii|@ugly') == (
+            '# {"key":"value","hello world":"\\u3053\\u3093\\u306b\\u3061\\u306f\\u4e16\\u754c"}')
+        assert self.gjson.getj('@this') == str(self.gjson)
+
     def test_module_get_as_str_raise(self):
         """It should raise a GJSONError with the proper message on failure."""
         with pytest.raises(gjson.GJSONError, match=r'^Empty query.'):
@@ -887,6 +1034,11 @@ class TestJSONOutput:
         output = gjson.GJSON({'key2': 'value2', 'key1': 'value1'}).getj('@pretty:{"sortKeys": true, "prefix": "## "}')
         assert output == '## {\n##   "key1": "value1",\n##   "key2": "value2"\n## }'
 
+    def test_modifier_pretty_prefix_valid(self):
+        """It should validate the object also when the prefix is set and apply it to the JSON string."""
+        output = gjson.GJSON({'key': 'value'}).getj('@pretty:{"prefix": "## "}|@valid')
+        assert output == '## {\n##   "key": "value"\n## }'
+
     def test_modifier_ugly(self):
         """It should uglyfy the JSON string."""
         assert gjson.get(self.obj, '@ugly', as_str=True) == (
@@ -963,6 +1115,15 @@ class TestCustomModifiers:
         obj = gjson.GJSONObj(self.valid_obj, self.query, custom_modifiers={'sum': custom_sum})
         assert obj.get() == 15
 
+    def test_gjsonobj_custom_modifiers_options_not_shared(self):
+        """It should pass to the custom modifiers a copy of the options of the cached query."""
+        def pop_modifier(options, obj, *, last):
+            del last  # unused argument
+            return options.pop('key', None), obj
+
+        for _ in range(2):
+            assert gjson.GJSONObj(1, '@pop:{"key": 2}', custom_modifiers={'pop': pop_modifier}).get() == (2, 1)
+
     def test_gjsonobj_custom_modifiers_raise(self):
         """It should encapsulate the modifier raised exception in a GJSONError."""
         with pytest.raises(gjson.GJSONError, match=fr'^{re.escape("Modifier @sum raised an exception")}'):